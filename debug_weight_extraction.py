@@ -1,10 +1,375 @@
 import os
-from PyPDF2 import PdfReader
+import io
 import re
 import tkinter as tk
 from tkinter import filedialog, ttk, scrolledtext, messagebox
 import json
 import webbrowser
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from functools import lru_cache
+
+# Candidate line search shared with the extractor, so both find the same lines
+from pdf_text_extractor import _ASCII_LOWER, _line_after, _iter_total_lines
+
+try:
+    import fitz  # PyMuPDF: C-backed text extraction, much faster than PyPDF2
+except ImportError:
+    fitz = None
+    from PyPDF2 import PdfReader
+
+# Helper patterns for split numbers, compiled once instead of per line.
+# Anchored patterns are used with match() rather than search().
+_RE_DIGITS_ONLY = re.compile(r'^\s*(\d+)\s*$')  # Line holding only digits
+_RE_SINGLE_DIGIT = re.compile(r'^\s*(\d)\s*$')  # Line holding a single digit
+
+# PDFs with at least this many pages are split across a process pool
+_PARALLEL_MIN_PAGES = 8
+
+# PDFs up to this size are read into memory in one go before parsing
+_IN_MEMORY_MAX_BYTES = 50 * 1024 * 1024
+
+# Comprehensive set of regex patterns for weight extraction
+# Each pattern handles a different format or edge case. Patterns are searched one
+# line at a time, so numbers split across lines ("Total" / "1234." / ".5") are left
+# to the split-number strategy rather than to patterns spanning newlines.
+_WEIGHT_PATTERN_SOURCES = (
+    # Standard formats with explicit "Total Weight" or "KG" units
+    r'Total\s+Weight\s*=\s*(\d+[.,]?\d*)\s*KG',
+    r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+[.,]?\d*)',
+    r'Total\s*(\d+[.,]?\d*)',
+    r'Total(\d+)[.,](\d+)',
+    r'Total(\d+)',
+    
+    # Variations with different separators and optional units
+    r'Total\s*(\d+)\s*[.,]\s*(\d+)',
+    r'Total\s*(\d+)\s*[.,]?\s*(\d+)',
+    r'Total\s*(\d+)\s*[.,]?\s*(\d+)\s*KG',
+    r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)',
+    r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)\s*KG',
+    
+    # Patterns for carriage returns left inside a line
+    r'Total\s*(\d+)\s*[.,]\s*\r\s*(\d+)',
+    
+    # Generic patterns for line breaks and whitespace
+    r'Total\s*(\d+)\s*[.,]\s*[\n\r]+\s*(\d+)',
+    r'Total\s*(\d+)\s*[.,]\s*\s*(\d+)',
+    
+    # Numbers split at a period by a carriage return
+    r'Total\s*(\d+)\s*\.\s*\r\s*(\d+)'
+)
+
+# Compiled once, in priority order; the first pattern that yields a weight wins
+_WEIGHT_PATTERNS = tuple((source, re.compile(source, re.IGNORECASE | re.MULTILINE))
+                         for source in _WEIGHT_PATTERN_SOURCES)
+
+# Gate for Strategy 2: lines that no pattern matches are skipped after one search.
+# The patterns themselves are still tried in order on the lines that pass.
+_WEIGHT_UNION = re.compile("|".join(f"(?:{source})" for source in _WEIGHT_PATTERN_SOURCES),
+                           re.IGNORECASE | re.MULTILINE)
+
+# The same patterns without those that require a literal "KG", for pages that
+# contain no "kg". Those patterns cannot match there, and dropping them leaves the
+# order of the rest unchanged, so the same pattern yields the weight.
+_NO_KG_WEIGHT_PATTERNS = tuple((source, compiled) for source, compiled in _WEIGHT_PATTERNS
+                               if 'KG' not in source)
+_NO_KG_WEIGHT_UNION = re.compile("|".join(f"(?:{source})" for source, _ in _NO_KG_WEIGHT_PATTERNS),
+                                 re.IGNORECASE | re.MULTILINE)
+
+def _split_whole_part(line):
+    """
+    Returns the digits of a stripped line holding only a whole number, optionally
+    followed by a period (e.g. "1234."), or None. Scanned by hand rather than with
+    a regex since it is checked for every line after a lone "Total".
+    """
+    whole_part = line[:-1] if line.endswith('.') else line
+    if whole_part.isdecimal():
+        return whole_part
+    return None
+
+def _split_decimal_part(line):
+    """
+    Returns the run of digits at the start of a stripped line, skipping one
+    leading period (e.g. ".56 KG" -> "56"), or None if there are no digits.
+    """
+    start = 1 if line.startswith('.') else 0
+    end = start
+    while end < len(line) and line[end].isdecimal():
+        end += 1
+    if end == start:
+        return None
+    return line[start:end]
+
+def _read_pdf_bytes(file_path):
+    """
+    Returns the contents of the PDF, or None if it is too large to hold in memory.
+    Parsing from memory replaces the parser's many small seeks and reads on the
+    file with a single read, which matters most on network drives.
+    """
+    if os.path.getsize(file_path) > _IN_MEMORY_MAX_BYTES:
+        return None
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+def _open_document(file_path):
+    """Opens the PDF with PyMuPDF, from memory unless it is very large."""
+    data = _read_pdf_bytes(file_path)
+    if data is None:
+        return fitz.open(file_path)
+    return fitz.open(stream=data, filetype="pdf")
+
+def _open_pdf_file(file_path):
+    """Opens the PDF for PyPDF2, as an in-memory buffer unless it is very large."""
+    data = _read_pdf_bytes(file_path)
+    if data is None:
+        return open(file_path, 'rb')
+    return io.BytesIO(data)
+
+def _decimal_tail(line, start):
+    """
+    Returns the digits after the first '.' or ',' at or after start that is followed
+    by (optional whitespace and) digits, e.g. "56" for " KG. 56", or None.
+    Scans the line in place instead of slicing it for a regex search.
+    """
+    length = len(line)
+    for sep in range(start, length):
+        if line[sep] == '.' or line[sep] == ',':
+            end = sep + 1
+            while end < length and line[end].isspace():
+                end += 1
+            digits_start = end
+            while end < length and line[end].isdecimal():
+                end += 1
+            if end > digits_start:
+                return line[digits_start:end]
+    return None
+
+def _count_pages(file_path):
+    """Returns the number of pages in the PDF."""
+    if fitz is not None:
+        with _open_document(file_path) as doc:
+            return doc.page_count
+    with _open_pdf_file(file_path) as file:
+        return len(PdfReader(file).pages)
+
+def _iter_page_texts(file_path, start=0, stop=None):
+    """
+    Yields the plain text of pages start..stop-1 (all pages by default),
+    using PyMuPDF when installed and PyPDF2 otherwise.
+    """
+    if fitz is not None:
+        with _open_document(file_path) as doc:
+            stop = doc.page_count if stop is None else stop
+            for page_index in range(start, stop):
+                yield doc[page_index].get_text("text")
+    else:
+        with _open_pdf_file(file_path) as file:
+            reader = PdfReader(file)
+            stop = len(reader.pages) if stop is None else stop
+            for page_index in range(start, stop):
+                yield reader.pages[page_index].extract_text()
+
+def _analyze_page(page_num, text):
+    """
+    Runs both extraction strategies on the text of one page.
+    Returns (weight_found, output) where output is the list of debug text chunks
+    for the page. Kept at module level so it can run in a worker process.
+    """
+    out = []
+    
+    # Show context for debugging
+    out.append(f"=== Page {page_num + 1} ===\n")
+    out.append("Context (last 500 characters):\n")
+    out.append("-" * 50 + "\n")
+    out.append(text[-500:] + "\n")
+    out.append("-" * 50 + "\n\n")
+    
+    # Every weight pattern needs the word "Total", so pages without it
+    # can skip the regex work entirely
+    lowered = text.translate(_ASCII_LOWER)
+    if 'total' not in lowered:
+        out.append("No weight found on this page\n")
+        out.append("=" * 50 + "\n\n")
+        return False, out
+    
+    # Pick the patterns for the page; "\u212a" (Kelvin sign) also matches "k" case-insensitively
+    if 'kg' in lowered or '\u212a' in text:
+        weight_union, weight_patterns = _WEIGHT_UNION, _WEIGHT_PATTERNS
+    else:
+        weight_union, weight_patterns = _NO_KG_WEIGHT_UNION, _NO_KG_WEIGHT_PATTERNS
+    
+    # Look for weight information using multiple strategies
+    weight_found = False
+    # Both strategies need "Total" on the line, so only those lines are visited.
+    # The page is not split into a list of lines; the lines after a candidate
+    # are sliced out only when a strategy needs them.
+    for line, line_end in _iter_total_lines(text, lowered):
+        # Strategy 1: Look for "Total" on its own line
+        # This handles cases where the number is split across multiple lines
+        if line.strip().lower() == "total" and line_end < len(text):
+            next_line, next_end = _line_after(text, line_end)
+            next_line = next_line.strip()
+            # Look for a number that might end with a period
+            whole_part = _split_whole_part(next_line)
+            if whole_part is not None:
+                # Check next line for decimal part
+                if next_end < len(text):
+                    decimal_line = _line_after(text, next_end)[0].strip()
+                    decimal_part = _split_decimal_part(decimal_line)
+                    if decimal_part is not None:
+                        weight = float(f"{whole_part}.{decimal_part}")
+                        out.append(f"Found split number:\n")
+                        out.append(f"Whole part: {whole_part}\n")
+                        out.append(f"Decimal part: {decimal_part}\n")
+                        out.append(f"Extracted weight: {weight} KG\n")
+                        out.append("=" * 50 + "\n\n")
+                        weight_found = True
+                        break
+        
+        # Strategy 2: Try all regex patterns, in order, on lines where any of them matches
+        if not weight_found and weight_union.search(line):
+            for pattern, compiled_pattern in weight_patterns:
+                for match in compiled_pattern.finditer(line):
+                    out.append(f"Pattern: {pattern}\n")
+                    out.append(f"Full match: {match.group(0)}\n")
+                    out.append(f"Groups: {match.groups()}\n")
+                    
+                    try:
+                        # Handle different match group configurations
+                        if len(match.groups()) == 2:
+                            # Direct match of whole and decimal parts
+                            whole_part = match.group(1).replace(' ', '')
+                            decimal_part = match.group(2)
+                            weight = float(f"{whole_part}.{decimal_part}")
+                        else:
+                            # Handle single group matches with various formats
+                            weight_str = match.group(1).replace(' ', '')
+                            
+                            # Case 1: Line ends with a period
+                            if line.strip().endswith('.'):
+                                if line_end < len(text):
+                                    next_line = _line_after(text, line_end)[0].strip()
+                                    decimal_match = _RE_DIGITS_ONLY.match(next_line)
+                                    if decimal_match:
+                                        weight = float(f"{weight_str}.{decimal_match.group(1)}")
+                                    else:
+                                        weight = float(weight_str)
+                                else:
+                                    weight = float(weight_str)
+                            else:
+                                # Case 2: Look for decimal part in current line
+                                decimal_part = _decimal_tail(line, match.end())
+                                if decimal_part is not None:
+                                    weight = float(f"{weight_str}.{decimal_part}")
+                                else:
+                                    # Case 3: Check next line for additional digits
+                                    if line_end < len(text):
+                                        next_line = _line_after(text, line_end)[0].strip()
+                                        digit_match = _RE_SINGLE_DIGIT.match(next_line)
+                                        if digit_match:
+                                            weight_str += digit_match.group(1)
+                                            out.append(f"Found additional digit on next line: {digit_match.group(1)}\n")
+                                    weight = float(weight_str)
+                        
+                        out.append(f"Extracted weight: {weight} KG\n")
+                        out.append("=" * 50 + "\n\n")
+                        weight_found = True
+                        break
+                    except ValueError as e:
+                        out.append(f"Error converting to float: {str(e)}\n")
+                        out.append("=" * 50 + "\n\n")
+                
+                if weight_found:
+                    break
+        
+        if weight_found:
+            break
+    
+    if not weight_found:
+        out.append("No weight found on this page\n")
+        out.append("=" * 50 + "\n\n")
+    
+    return weight_found, out
+
+def _analyze_page_range(file_path, start, stop):
+    """
+    Extracts and analyzes pages start..stop-1 of the PDF.
+    Used directly for small files and as the worker function for large ones, where
+    each worker opens the PDF itself so text extraction also runs in parallel.
+    """
+    return [_analyze_page(page_num, text)
+            for page_num, text in enumerate(_iter_page_texts(file_path, start, stop), start)]
+
+class _AnalysisError(Exception):
+    """
+    Raised by _build_report when the analysis fails, carrying the report up to and
+    including the error message. Exceptions are not memoized by lru_cache, so a
+    transient failure (e.g. a locked file) is retried on the next Analyze.
+    """
+    def __init__(self, report):
+        super().__init__(report)
+        self.report = report
+
+def _build_report(file_path, analyze_all):
+    """
+    Uses multiple patterns and strategies to extract weights, handling various formats
+    and edge cases like split numbers and line breaks. Returns the debug report text,
+    or raises _AnalysisError with the partial report if the analysis fails.
+    """
+    # Output is collected in a list and inserted into the widget in one go, since
+    # every insert is a round trip into Tcl and triggers a relayout
+    out = [f"=== PDF Analysis: {os.path.basename(file_path)} ===\n\n"]
+    
+    try:
+        if analyze_all:
+            page_count = _count_pages(file_path)
+            if page_count >= _PARALLEL_MIN_PAGES:
+                results = _analyze_pages_parallel(file_path, page_count)
+            else:
+                results = _analyze_page_range(file_path, 0, page_count)
+            
+            for _, page_out in results:
+                out.extend(page_out)
+        else:
+            # Stream pages so the remaining ones are never extracted once a weight is found
+            for page_num, text in enumerate(_iter_page_texts(file_path)):
+                weight_found, page_out = _analyze_page(page_num, text)
+                out.extend(page_out)
+                if weight_found:
+                    break
+        
+        out.append("Analysis complete!\n")
+        
+    except Exception as e:
+        out.append(f"Error analyzing PDF: {str(e)}\n")
+        raise _AnalysisError("".join(out))
+    
+    return "".join(out)
+
+def _analyze_pages_parallel(file_path, page_count):
+    """
+    Splits the pages into one contiguous range per worker process and returns
+    the per-page results in page order.
+    """
+    # Windows rejects more than 61 worker processes
+    workers = min(os.cpu_count() or 1, 61, page_count)
+    chunk = -(-page_count // workers)  # Ceiling division
+    starts = range(0, page_count, chunk)
+    stops = [min(start + chunk, page_count) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(_analyze_page_range, repeat(file_path), starts, stops)
+        return [result for chunk_results in chunks for result in chunk_results]
+
+@lru_cache(maxsize=32)
+def _cached_report(file_path, mtime_ns, size, analyze_all):
+    """
+    Memoized _build_report. The file's mtime and size are part of the key, so
+    re-analyzing an unchanged PDF is free and a modified one is analyzed again.
+    Failed analyses raise _AnalysisError and are therefore not cached.
+    """
+    return _build_report(file_path, analyze_all)
 
 class WeightDebuggerGUI:
     """
@@ -31,7 +396,8 @@ class WeightDebuggerGUI:
         
         self.file_path_var = tk.StringVar()
         ttk.Entry(file_frame, textvariable=self.file_path_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        ttk.Button(file_frame, text="Browse", command=self.select_file).pack(side=tk.LEFT, padx=5)
+        self.browse_button = ttk.Button(file_frame, text="Browse", command=self.select_file)
+        self.browse_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(file_frame, text="Open in Browser", command=self.open_in_browser).pack(side=tk.LEFT, padx=5)
         
         # Debug output frame with scrollable text widget
@@ -45,53 +411,16 @@ class WeightDebuggerGUI:
         button_frame = ttk.Frame(main_container)
         button_frame.pack(fill=tk.X, pady=10)
         
-        ttk.Button(button_frame, text="Analyze PDF", command=self.analyze_pdf).pack(side=tk.LEFT, padx=5)
+        self.analyze_button = ttk.Button(button_frame, text="Analyze PDF", command=self.analyze_pdf)
+        self.analyze_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Copy Debug Output", command=self.copy_debug_output).pack(side=tk.LEFT, padx=5)
         
-        # Comprehensive set of regex patterns for weight extraction
-        # Each pattern handles a different format or edge case
-        self.weight_patterns = [
-            # Standard formats with explicit "Total Weight" or "KG" units
-            r'Total\s+Weight\s*=\s*(\d+[.,]?\d*)\s*KG',
-            r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+[.,]?\d*)',
-            r'Total\s*(\d+[.,]?\d*)',
-            r'Total(\d+)[.,](\d+)',
-            r'Total(\d+)',
-            
-            # Variations with different separators and optional units
-            r'Total\s*(\d+)\s*[.,]\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]?\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]?\s*(\d+)\s*KG',
-            r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)',
-            r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)\s*KG',
-            
-            # Patterns for handling line breaks with different line endings
-            r'Total\s*(\d+)\s*[.,]\s*\n\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]\s*\r\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]\s*\r\n\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]\s*$[\n\r]*\s*(\d+)',
-            
-            # Generic patterns for line breaks and whitespace
-            r'Total\s*(\d+)\s*[.,]\s*[\n\r]+\s*(\d+)',
-            r'Total\s*(\d+)\s*[.,]\s*\s*(\d+)',
-            
-            # Patterns for numbers split across lines with periods
-            r'Total\s*(\d+)\s*\.\s*\n\s*(\d+)',
-            r'Total\s*(\d+)\s*\.\s*\r\s*(\d+)',
-            r'Total\s*(\d+)\s*\.\s*\r\n\s*(\d+)',
-            r'Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-            
-            # Special cases for numbers ending with periods
-            r'Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-            r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-            
-            # Specific patterns for the target PDF format
-            r'Total\s*\n\s*(\d+)\s*\n\s*\.\s*(\d+)',
-            r'Total\s*\n\s*(\d+)\s*\.\s*\n\s*(\d+)',
-            r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)',
-            r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)\s*Status',
-            r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)\s*Status\s+C\s*\(Resubmit\)'
-        ]
+        # By default analysis stops at the first page with a weight; drawings carry one total
+        self.analyze_all_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Analyze all pages", variable=self.analyze_all_var).pack(side=tk.LEFT, padx=5)
+        
+        # Background thread running the current analysis, if any
+        self.analysis_thread = None
 
     def select_file(self):
         """Opens a file dialog to select a PDF and automatically starts analysis."""
@@ -119,131 +448,49 @@ class WeightDebuggerGUI:
     def analyze_pdf(self):
         """
         Analyzes the selected PDF file for weight information.
-        Uses multiple patterns and strategies to extract weights, handling various formats
-        and edge cases like split numbers and line breaks.
+        The work runs on a background thread so the window stays responsive;
+        the report is handed back to the Tk main loop when it is complete.
         """
         file_path = self.file_path_var.get()
-        if not file_path:
+        if not file_path or (self.analysis_thread and self.analysis_thread.is_alive()):
             return
         
+        # Browse is disabled too, so a file picked now cannot show the running analysis's report
+        self.analyze_button.state(['disabled'])
+        self.browse_button.state(['disabled'])
         self.debug_text.delete(1.0, tk.END)
-        self.debug_text.insert(tk.END, f"=== PDF Analysis: {os.path.basename(file_path)} ===\n\n")
+        self.debug_text.insert(tk.END, f"Analyzing {os.path.basename(file_path)}...\n")
         
+        # Tk variables are read here since they must not be touched from the worker thread
+        analyze_all = self.analyze_all_var.get()
+        self.analysis_thread = threading.Thread(target=self._run_analysis,
+                                                args=(file_path, analyze_all), daemon=True)
+        self.analysis_thread.start()
+
+    def _run_analysis(self, file_path, analyze_all):
+        """Builds the report on the worker thread and schedules its display on the main thread."""
         try:
-            with open(file_path, 'rb') as file:
-                reader = PdfReader(file)
-                
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    # Show context for debugging
-                    self.debug_text.insert(tk.END, f"=== Page {page_num + 1} ===\n")
-                    self.debug_text.insert(tk.END, "Context (last 500 characters):\n")
-                    self.debug_text.insert(tk.END, "-" * 50 + "\n")
-                    self.debug_text.insert(tk.END, text[-500:] + "\n")
-                    self.debug_text.insert(tk.END, "-" * 50 + "\n\n")
-                    
-                    # Process text line by line for better handling of line breaks
-                    lines = text.split('\n')
-                    
-                    # Look for weight information using multiple strategies
-                    weight_found = False
-                    for i, line in enumerate(lines):
-                        # Strategy 1: Look for "Total" on its own line
-                        # This handles cases where the number is split across multiple lines
-                        if line.strip().lower() == "total" and i + 1 < len(lines):
-                            next_line = lines[i + 1].strip()
-                            # Look for a number that might end with a period
-                            number_match = re.search(r'^(\d+)(?:\.)?$', next_line)
-                            if number_match:
-                                whole_part = number_match.group(1)
-                                # Check next line for decimal part
-                                if i + 2 < len(lines):
-                                    decimal_line = lines[i + 2].strip()
-                                    decimal_match = re.search(r'^\.?(\d+)', decimal_line)
-                                    if decimal_match:
-                                        decimal_part = decimal_match.group(1)
-                                        weight = float(f"{whole_part}.{decimal_part}")
-                                        self.debug_text.insert(tk.END, f"Found split number:\n")
-                                        self.debug_text.insert(tk.END, f"Whole part: {whole_part}\n")
-                                        self.debug_text.insert(tk.END, f"Decimal part: {decimal_part}\n")
-                                        self.debug_text.insert(tk.END, f"Extracted weight: {weight} KG\n")
-                                        self.debug_text.insert(tk.END, "=" * 50 + "\n\n")
-                                        weight_found = True
-                                        break
-                        
-                        # Strategy 2: Try all regex patterns
-                        if not weight_found:
-                            for pattern in self.weight_patterns:
-                                matches = re.finditer(pattern, line, re.IGNORECASE | re.MULTILINE)
-                                for match in matches:
-                                    self.debug_text.insert(tk.END, f"Pattern: {pattern}\n")
-                                    self.debug_text.insert(tk.END, f"Full match: {match.group(0)}\n")
-                                    self.debug_text.insert(tk.END, f"Groups: {match.groups()}\n")
-                                    
-                                    try:
-                                        # Handle different match group configurations
-                                        if len(match.groups()) == 2:
-                                            # Direct match of whole and decimal parts
-                                            whole_part = match.group(1).replace(' ', '')
-                                            decimal_part = match.group(2)
-                                            weight = float(f"{whole_part}.{decimal_part}")
-                                        else:
-                                            # Handle single group matches with various formats
-                                            weight_str = match.group(1).replace(' ', '')
-                                            
-                                            # Case 1: Line ends with a period
-                                            if line.strip().endswith('.'):
-                                                if i + 1 < len(lines):
-                                                    next_line = lines[i + 1].strip()
-                                                    decimal_match = re.search(r'^\s*(\d+)\s*$', next_line)
-                                                    if decimal_match:
-                                                        weight = float(f"{weight_str}.{decimal_match.group(1)}")
-                                                    else:
-                                                        weight = float(weight_str)
-                                                else:
-                                                    weight = float(weight_str)
-                                            else:
-                                                # Case 2: Look for decimal part in current line
-                                                decimal_match = re.search(r'[.,]\s*(\d+)', line[match.end():])
-                                                if decimal_match:
-                                                    weight = float(f"{weight_str}.{decimal_match.group(1)}")
-                                                else:
-                                                    # Case 3: Check next line for additional digits
-                                                    if i + 1 < len(lines):
-                                                        next_line = lines[i + 1].strip()
-                                                        digit_match = re.search(r'^\s*(\d)\s*$', next_line)
-                                                        if digit_match:
-                                                            weight_str += digit_match.group(1)
-                                                            self.debug_text.insert(tk.END, f"Found additional digit on next line: {digit_match.group(1)}\n")
-                                                    weight = float(weight_str)
-                                        
-                                        self.debug_text.insert(tk.END, f"Extracted weight: {weight} KG\n")
-                                        self.debug_text.insert(tk.END, "=" * 50 + "\n\n")
-                                        weight_found = True
-                                        break
-                                    except ValueError as e:
-                                        self.debug_text.insert(tk.END, f"Error converting to float: {str(e)}\n")
-                                        self.debug_text.insert(tk.END, "=" * 50 + "\n\n")
-                                
-                                if weight_found:
-                                    break
-                        
-                        if weight_found:
-                            break
-                    
-                    if not weight_found:
-                        self.debug_text.insert(tk.END, "No weight found on this page\n")
-                        self.debug_text.insert(tk.END, "=" * 50 + "\n\n")
-                
-                self.debug_text.insert(tk.END, "Analysis complete!\n")
-                
-        except Exception as e:
-            self.debug_text.insert(tk.END, f"Error analyzing PDF: {str(e)}\n")
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                # Let _build_report produce the error message for a missing file
+                report = _build_report(file_path, analyze_all)
+            else:
+                report = _cached_report(file_path, stat.st_mtime_ns, stat.st_size, analyze_all)
+        except _AnalysisError as e:
+            report = e.report
+        self.root.after(0, self._show_report, report)
+
+    def _show_report(self, report):
+        """Replaces the debug output with the finished report and re-enables the buttons."""
+        self.debug_text.delete(1.0, tk.END)
+        self.debug_text.insert(tk.END, report)
+        self.analyze_button.state(['!disabled'])
+        self.browse_button.state(['!disabled'])
 
 def main():
     """Entry point for the debugger application."""
+    multiprocessing.freeze_support()  # Needed for the page worker pool in frozen builds
     root = tk.Tk()
     app = WeightDebuggerGUI(root)
     root.mainloop()
@@ -1,14 +1,67 @@
 import os
-from PyPDF2 import PdfReader
+import io
+import sys
+import subprocess
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import re
 import json
+import logging
 import csv
+import string
+import hashlib
 from collections import defaultdict
-import pandas as pd
+from functools import lru_cache
+import xlsxwriter
 from datetime import datetime
 import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+pdfium = None
+try:
+    import fitz  # PyMuPDF: C-backed text extraction, much faster than PyPDF2
+except ImportError:
+    fitz = None
+    try:
+        import pypdfium2 as pdfium  # PDFium: C++ text extraction, used when PyMuPDF is missing
+    except ImportError:
+        from PyPDF2 import PdfReader
+
+# Minimum seconds between progress redraws while processing (about 10 Hz)
+_UI_UPDATE_INTERVAL = 0.1
+
+# Results are added to the table this many rows at a time, with the next batch
+# loaded once the visible part of the table is past this fraction of its rows
+_RESULTS_BATCH_SIZE = 200
+_RESULTS_LOAD_THRESHOLD = 0.9
+
+# Worker processes for parsing PDFs. Windows rejects more than 61, so the count
+# is capped there even on workstations with more threads
+_MAX_WORKERS = min(os.cpu_count() or 1, 61)
+
+# Extracted page text is kept here between runs, one JSON file per PDF version
+_TEXT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.rebar_pdf_cache')
+# Part of every cache key; bump it when the extracted text would change
+_TEXT_CACHE_VERSION = 1
+# Entries unused for longer than this, or beyond the size cap (least recently used
+# first), are removed at startup
+_TEXT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+_TEXT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+# Turned off with --no-cache; passed on to the PDF worker processes
+_text_cache_enabled = True
+
+# Text extraction library in use, part of the cache key since each produces different text
+if fitz is not None:
+    _TEXT_BACKEND = 'pymupdf'
+elif pdfium is not None:
+    _TEXT_BACKEND = 'pypdfium2'
+else:
+    _TEXT_BACKEND = 'pypdf2'
+
+# Extraction details are logged at DEBUG level and only shown when run with --debug
+logger = logging.getLogger(__name__)
 
 class DrawingInfo:
     """
@@ -57,6 +110,19 @@ class PDFAnalyzerGUI:
         self.current_fact_index = 0
         self.fact_update_interval = 15000  # 15 seconds in milliseconds
         
+        # Progress counters read by the time remaining estimate, and its pending refresh
+        self._start_time = 0
+        self._total_files = 0
+        self._processed_files = 0
+        self._time_after_id = None
+        
+        # Time and whole percentage of the last progress redraw, for throttling
+        self._last_ui_update = 0.0
+        self._last_ui_percent = None
+        
+        # Set while PDFs are being processed; the fact and timer callbacks stop when it clears
+        self._processing = threading.Event()
+        
         # Configure modern UI styles
         style = ttk.Style()
         style.configure("TButton", padding=6, relief="flat", background="#2196F3")
@@ -67,6 +133,14 @@ class PDFAnalyzerGUI:
         style.configure("TLabelframe", padding=10)
         style.configure("TLabelframe.Label", font=("Helvetica", 10, "bold"))
         
+        # Styles for the duplicate resolution dialog, configured once here
+        # rather than each time a dialog opens
+        style.configure("Title.TLabel", wraplength=600, font=("Helvetica", 9))
+        style.configure("Weight.TLabel", font=("Helvetica", 9, "bold"))
+        style.configure("Summary.TLabel", font=("Helvetica", 10, "bold"))
+        style.configure("Group.TLabelframe", padding=5)
+        style.configure("Group.TLabelframe.Label", font=("Helvetica", 9, "bold"))
+        
         # Create main container with padding
         main_container = ttk.Frame(root)
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -155,10 +229,18 @@ class PDFAnalyzerGUI:
         self.tree.heading("Weight", text="Weight (KG)")
         self.tree.heading("Pages", text="Pages")
         
+        # Alternate row color, used by update_results
+        self.tree.tag_configure('evenrow', background='#f0f0f0')
+        
         # Add scrollbars
         y_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
         x_scrollbar = ttk.Scrollbar(results_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        self.tree_y_scrollbar = y_scrollbar
+        self.tree.configure(yscrollcommand=self.on_tree_scroll, xscrollcommand=x_scrollbar.set)
+        
+        # Results are inserted into the tree in batches as the user scrolls
+        self.result_rows = []
+        self.inserted_rows = 0
         
         # Grid layout for tree and scrollbars
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 2))
@@ -184,8 +266,13 @@ class PDFAnalyzerGUI:
                                      command=self.start_analysis, width=20)
         self.start_button.pack(side=tk.RIGHT, padx=5)
         
-        # Store the latest Excel file path
-        self.latest_excel_path = None
+        # Results are written as CSV unless Excel output is requested
+        self.excel_output_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Save as Excel (.xlsx)",
+                        variable=self.excel_output_var).pack(side=tk.RIGHT, padx=5)
+        
+        # Store the latest results file path
+        self.latest_results_path = None
         
         # Bind window resize event
         self.root.bind('<Configure>', self.on_window_resize)
@@ -206,50 +293,68 @@ class PDFAnalyzerGUI:
             self.tree.column("Title", width=tree_width - 300)  # Adjust for other columns
 
     def update_progress(self, value, status):
-        """Update progress bar and status with smooth animation"""
+        """
+        Update progress bar and status with smooth animation.
+        The window is only redrawn when the whole percentage changes, and at most every
+        _UI_UPDATE_INTERVAL seconds (always at 100%), so large batches of small PDFs
+        are not dominated by redraws.
+        """
         self.progress_var.set(value)
         self.status_var.set(status)
+        percent = int(value)
+        if percent == self._last_ui_percent:
+            return
+        now = time.monotonic()
+        if now - self._last_ui_update < _UI_UPDATE_INTERVAL and value < 100:
+            return
+        self._last_ui_update = now
+        self._last_ui_percent = percent
         self.root.update_idletasks()
 
     def update_results(self, processed_drawings):
-        """Update results tree with smooth animation"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add new items with alternating colors
-        for drawing_number, drawings in processed_drawings.items():
-            for drawing in drawings:
-                page_count = len(drawing['page_weights'])
-                item = self.tree.insert("", tk.END, values=(
-                    drawing_number,
-                    drawing.get('revision', ''),
-                    drawing['title'],
-                    f"{drawing['weight']:.1f}",
-                    f"{page_count} pages"
-                ))
-                # Alternate row colors
-                if self.tree.index(item) % 2 == 0:
-                    self.tree.tag_configure('evenrow', background='#f0f0f0')
-                    self.tree.item(item, tags=('evenrow',))
+        """
+        Update results tree with smooth animation.
+        Only the first batch of rows is inserted here; on_tree_scroll adds the
+        rest as they are scrolled into reach, so large result sets stay responsive.
+        """
+        # Clear existing items in a single call
+        self.tree.delete(*self.tree.get_children())
         
-        self.root.update_idletasks()
+        self.result_rows = list(iter_result_rows(processed_drawings))
+        self.inserted_rows = 0
+        self.insert_result_batch()
+
+    def insert_result_batch(self):
+        """Insert the next batch of result rows into the tree"""
+        start = self.inserted_rows
+        rows = self.result_rows[start:start + _RESULTS_BATCH_SIZE]
+        
+        # Add new items with alternating colors; the row index is counted here
+        # rather than asking the tree for each item's position
+        for row_index, (drawing_number, revision, title, weight, page_weights, _) in enumerate(rows, start):
+            self.tree.insert("", tk.END, values=(
+                drawing_number,
+                revision,
+                title,
+                f"{weight:.1f}",
+                f"{len(page_weights)} pages"
+            ), tags=('evenrow',) if row_index % 2 == 0 else ())
+        self.inserted_rows += len(rows)
+
+    def on_tree_scroll(self, first, last):
+        """Update the scrollbar and load more rows once the view nears the end of the tree"""
+        self.tree_y_scrollbar.set(first, last)
+        if float(last) >= _RESULTS_LOAD_THRESHOLD and self.inserted_rows < len(self.result_rows):
+            self.insert_result_batch()
 
     def open_results(self):
-        """Open the Excel results file"""
-        if self.latest_excel_path and os.path.exists(self.latest_excel_path):
+        """Open the results file"""
+        if self.latest_results_path and os.path.exists(self.latest_results_path):
             try:
-                os.startfile(self.latest_excel_path)  # Windows
-            except AttributeError:
-                try:
-                    import subprocess
-                    subprocess.call(['open', self.latest_excel_path])  # macOS
-                except:
-                    try:
-                        subprocess.call(['xdg-open', self.latest_excel_path])  # Linux
-                    except:
-                        messagebox.showerror("Error", "Could not open the results file automatically. "
-                                           f"Please open it manually at: {self.latest_excel_path}")
+                open_with_default_app(self.latest_results_path)
+            except OSError:
+                messagebox.showerror("Error", "Could not open the results file automatically. "
+                                   f"Please open it manually at: {self.latest_results_path}")
         else:
             messagebox.showerror("Error", "No results file available. Please run the analysis first.")
 
@@ -295,42 +400,37 @@ class PDFAnalyzerGUI:
         """Cycle to the next rebar fact"""
         self.current_fact_index = (self.current_fact_index + 1) % len(self.rebar_facts)
         self.fact_var.set("Did you know? " + self.rebar_facts[self.current_fact_index])
-        if hasattr(self, 'processing') and self.processing:
+        if self._processing.is_set():
             self.root.after(self.fact_update_interval, self.cycle_fact)
 
-    def update_time_remaining(self, start_time, total_files, processed_files):
-        """Update the estimated time remaining"""
+    def update_time_remaining(self):
+        """
+        Update the estimated time remaining from the current progress counters.
+        While processing, the label refreshes itself every second; a direct call
+        cancels the pending refresh so only one is ever scheduled.
+        """
+        if self._time_after_id is not None:
+            self.root.after_cancel(self._time_after_id)
+            self._time_after_id = None
+        
         try:
-            if not total_files or processed_files <= 0:
+            if not self._total_files or self._processed_files <= 0:
                 self.time_var.set("Estimated time remaining: Calculating...")
-                if hasattr(self, 'processing') and self.processing:
-                    self.root.after(1000, lambda: self.update_time_remaining(start_time, total_files, processed_files))
-                return
-            
-            elapsed_time = max(0.1, time.time() - start_time)  # Ensure we don't divide by zero
-            files_remaining = max(0, total_files - processed_files)
-            
-            # Protect against division by zero
-            try:
-                time_per_file = elapsed_time / processed_files
+            else:
+                elapsed_time = max(0.1, time.time() - self._start_time)  # Ensure we don't divide by zero
+                files_remaining = max(0, self._total_files - self._processed_files)
+                time_per_file = elapsed_time / self._processed_files
                 estimated_remaining = files_remaining * time_per_file
-            except (ZeroDivisionError, ValueError):
-                self.time_var.set("Estimated time remaining: Calculating...")
-                if hasattr(self, 'processing') and self.processing:
-                    self.root.after(1000, lambda: self.update_time_remaining(start_time, total_files, processed_files))
-                return
-            
-            minutes = int(estimated_remaining // 60)
-            seconds = int(estimated_remaining % 60)
-            self.time_var.set(f"Estimated time remaining: {minutes:02d}:{seconds:02d}")
-            
-            if hasattr(self, 'processing') and self.processing:
-                self.root.after(1000, lambda: self.update_time_remaining(start_time, total_files, processed_files))
+                
+                minutes = int(estimated_remaining // 60)
+                seconds = int(estimated_remaining % 60)
+                self.time_var.set(f"Estimated time remaining: {minutes:02d}:{seconds:02d}")
         except Exception as e:
             # If any error occurs, show calculating message and continue
             self.time_var.set("Estimated time remaining: Calculating...")
-            if hasattr(self, 'processing') and self.processing:
-                self.root.after(1000, lambda: self.update_time_remaining(start_time, total_files, processed_files))
+        
+        if self._processing.is_set():
+            self._time_after_id = self.root.after(1000, self.update_time_remaining)
 
     def process_pdfs(self, input_dir, output_dir):
         """Process all PDFs in the input directory"""
@@ -339,53 +439,45 @@ class PDFAnalyzerGUI:
             os.makedirs(output_dir, exist_ok=True)
             
             # Get all PDF files
-            pdf_files = [f for f in os.listdir(input_dir) if f.lower().endswith('.pdf')]
+            # scandir entries carry the name, full path and file type, so no extra
+            # stat or path join is needed per file
+            with os.scandir(input_dir) as entries:
+                pdf_entries = [entry for entry in entries
+                               if entry.is_file() and entry.name.lower().endswith('.pdf')]
             
-            if not pdf_files:
+            if not pdf_entries:
                 raise ValueError("No PDF files found in the input directory.")
             
             # Track processed drawings and duplicates
-            processed_drawings = {}
+            processed_drawings = defaultdict(list)  # drawing number -> list of drawing dicts
             duplicate_groups = []
-            total_files = len(pdf_files)
-            start_time = time.time()
-            self.processing = True
+            total_files = len(pdf_entries)
+            self._start_time = time.time()
+            self._total_files = total_files
+            self._processed_files = 0
+            self._last_ui_percent = None
+            self._processing.set()
             
             # Start cycling facts and updating time
             self.cycle_fact()
-            self.update_time_remaining(start_time, total_files, 0)
+            self.update_time_remaining()
             
-            # Process each PDF
-            for index, pdf_file in enumerate(pdf_files, 1):
-                pdf_path = os.path.join(input_dir, pdf_file)
-                self.update_progress((index / total_files) * 100, f"Processing: {pdf_file}")
-                self.update_time_remaining(start_time, total_files, index)
-                
-                # Extract drawing info
-                drawing_number, title = extract_drawing_info(pdf_file)
-                if drawing_number and title:
-                    # Extract revision from the PDF text
-                    full_text, pages_text = extract_text_from_pdf(pdf_path)
-                    if full_text:  # Check if text extraction was successful
-                        revision = extract_revision(full_text)
-                    else:
-                        revision = ""
-                    
-                    # Process the PDF and get weights
-                    weight, page_weights = extract_total_weight(pdf_path, output_dir)
+            # Process the PDFs in parallel; results come back in file order
+            with ProcessPoolExecutor(max_workers=_MAX_WORKERS, initializer=_init_worker,
+                                     initargs=(logger.getEffectiveLevel(), _text_cache_enabled)) as executor:
+                results = executor.map(_process_one, [entry.path for entry in pdf_entries], chunksize=4)
+                for index, (entry, result) in enumerate(zip(pdf_entries, results), 1):
+                    self.update_progress((index / total_files) * 100, f"Processing: {entry.name}")
+                    self._processed_files = index
+                    self.update_time_remaining()
                     
-                    # Initialize list for this drawing number if not exists
-                    if drawing_number not in processed_drawings:
-                        processed_drawings[drawing_number] = []
+                    # Files without a drawing number and title are skipped
+                    if result is None:
+                        continue
+                    drawing_number, drawing = result
                     
                     # Add the drawing info
-                    processed_drawings[drawing_number].append({
-                        'title': title,
-                        'revision': revision,
-                        'weight': weight,
-                        'page_weights': page_weights,
-                        'filename': pdf_file
-                    })
+                    processed_drawings[drawing_number].append(drawing)
             
             # Check for duplicates (any drawings with the same number)
             for drawing_number, drawings in processed_drawings.items():
@@ -403,39 +495,64 @@ class PDFAnalyzerGUI:
                 for drawing_number, selected_drawings in selections.items():
                     processed_drawings[drawing_number] = selected_drawings
             
-            # Save results to Excel
-            self.save_to_excel(processed_drawings, output_dir)
+            # Save results as CSV, or as Excel when requested
+            if self.excel_output_var.get():
+                self.save_to_excel(processed_drawings, output_dir)
+            else:
+                self.save_to_csv(processed_drawings, output_dir)
             
-            self.processing = False
+            self._processing.clear()
             return processed_drawings
             
         except Exception as e:
-            self.processing = False
+            self._processing.clear()
             raise Exception(f"Error processing PDFs: {str(e)}")
 
+    def save_to_csv(self, processed_drawings, output_dir):
+        """Save results to CSV file"""
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            csv_path = os.path.join(output_dir, f'drawing_weights_{timestamp}.csv')
+            
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(RESULT_COLUMNS)
+                writer.writerows(
+                    (drawing_number, revision, title, weight, str(page_weights), filename)
+                    for drawing_number, revision, title, weight, page_weights, filename
+                    in iter_result_rows(processed_drawings))
+            
+            # Store the path and enable the Open Results button
+            self.latest_results_path = csv_path
+            self.open_results_button.state(['!disabled'])
+            
+        except Exception as e:
+            raise Exception(f"Error saving to CSV: {str(e)}")
+
     def save_to_excel(self, processed_drawings, output_dir):
         """Save results to Excel file"""
         try:
-            rows = []
-            for drawing_number, drawings in processed_drawings.items():
-                for drawing in drawings:
-                    row = {
-                        'Drawing Number': drawing_number,
-                        'Revision': drawing.get('revision', ''),
-                        'Title': drawing['title'],
-                        'Total Weight (KG)': drawing['weight'],
-                        'Page Weights': str(drawing['page_weights']),
-                        'Filename': drawing['filename']
-                    }
-                    rows.append(row)
-            
-            df = pd.DataFrame(rows)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             excel_path = os.path.join(output_dir, f'drawing_weights_{timestamp}.xlsx')
-            df.to_excel(excel_path, index=False)
+            
+            # Rows are streamed to disk as they are written (constant_memory),
+            # so the whole workbook is never held in memory. Titles and filenames are
+            # written as plain text, never turned into formulas or hyperlinks.
+            workbook = xlsxwriter.Workbook(excel_path, {'constant_memory': True,
+                                                        'strings_to_formulas': False,
+                                                        'strings_to_urls': False})
+            worksheet = workbook.add_worksheet()
+            header_format = workbook.add_format({'bold': True, 'border': 1})
+            worksheet.write_row(0, 0, RESULT_COLUMNS, header_format)
+            
+            rows = iter_result_rows(processed_drawings)
+            for row, (drawing_number, revision, title, weight, page_weights, filename) in enumerate(rows, 1):
+                worksheet.write_row(row, 0, [drawing_number, revision, title, weight,
+                                             str(page_weights), filename])
+            workbook.close()
             
             # Store the path and enable the Open Results button
-            self.latest_excel_path = excel_path
+            self.latest_results_path = excel_path
             self.open_results_button.state(['!disabled'])
             
         except Exception as e:
@@ -513,9 +630,6 @@ class DuplicateResolutionDialog:
         scrollbar.pack(side="right", fill="y")
         self.canvas.pack(side="left", fill="both", expand=True)
         
-        # Configure styles
-        self.configure_styles()
-        
         # Add duplicate groups
         self.create_duplicate_groups()
         
@@ -529,35 +643,28 @@ class DuplicateResolutionDialog:
                   command=self.dialog.destroy).pack(side="right", padx=5)
 
     def sort_duplicates(self, duplicates):
-        """Sort duplicates by number of versions and then by weight similarity"""
+        """
+        Sort duplicates by number of versions and then by weight similarity.
+        Returns (drawing_number, drawings, weight_diffs) tuples, where weight_diffs are the
+        differences between consecutive drawings, computed once here for the group labels too.
+        """
         sorted_duplicates = []
         for drawing_number, drawings in duplicates:
             # Sort drawings by weight
             drawings = sorted(drawings, key=lambda x: x['weight'])
             
             # Calculate weight differences between consecutive drawings
-            max_diff = 0
-            for i in range(len(drawings)-1):
-                diff = abs(drawings[i]['weight'] - drawings[i+1]['weight'])
-                max_diff = max(max_diff, diff)
+            weight_diffs = [abs(current['weight'] - following['weight'])
+                            for current, following in zip(drawings, drawings[1:])]
             
-            # Store tuple of (drawing_number, drawings, num_duplicates, max_weight_difference)
-            sorted_duplicates.append((drawing_number, drawings, len(drawings), max_diff))
+            # Store tuple of (drawing_number, drawings, weight_diffs, max_weight_difference)
+            sorted_duplicates.append((drawing_number, drawings, weight_diffs, max(weight_diffs, default=0)))
         
         # Sort first by number of duplicates (descending), then by weight difference (ascending)
-        sorted_duplicates.sort(key=lambda x: (-x[2], x[3]))
+        sorted_duplicates.sort(key=lambda x: (-len(x[1]), x[3]))
         
-        # Return just the drawing_number and drawings
-        return [(num, drw) for num, drw, _, _ in sorted_duplicates]
-
-    def configure_styles(self):
-        """Configure ttk styles for the dialog"""
-        style = ttk.Style()
-        style.configure("Title.TLabel", wraplength=600, font=("Helvetica", 9))
-        style.configure("Weight.TLabel", font=("Helvetica", 9, "bold"))
-        style.configure("Summary.TLabel", font=("Helvetica", 10, "bold"))
-        style.configure("Group.TLabelframe", padding=5)
-        style.configure("Group.TLabelframe.Label", font=("Helvetica", 9, "bold"))
+        # Drop the sort key
+        return [(num, drw, diffs) for num, drw, diffs, _ in sorted_duplicates]
 
     def _on_frame_configure(self, event=None):
         """Reset the scroll region to encompass the inner frame"""
@@ -576,7 +683,7 @@ class DuplicateResolutionDialog:
 
     def create_duplicate_groups(self):
         """Create a group of checkboxes for each set of duplicates"""
-        for drawing_number, drawings in self.duplicates:
+        for drawing_number, drawings, weight_diffs in self.duplicates:
             # Create frame for this group
             group_frame = ttk.LabelFrame(self.scrollable_frame, 
                                        text=f"Drawing Number: {drawing_number} ({len(drawings)} versions)", 
@@ -584,15 +691,9 @@ class DuplicateResolutionDialog:
                                        style="Group.TLabelframe")
             group_frame.pack(fill="x", padx=5, pady=2)
             
-            # Calculate weight differences
-            weight_diffs = []
-            for i in range(len(drawings)-1):
-                diff = abs(drawings[i]['weight'] - drawings[i+1]['weight'])
-                weight_diffs.append(f"{diff:.2f}KG")
-            
             # Add weight difference info if available
             if weight_diffs:
-                diff_text = f"Weight differences: {' / '.join(weight_diffs)}"
+                diff_text = f"Weight differences: {' / '.join(f'{diff:.2f}KG' for diff in weight_diffs)}"
                 ttk.Label(group_frame, text=diff_text, style="Weight.TLabel").pack(fill="x", pady=(0, 5))
             
             # List to store checkboxes for this group
@@ -661,21 +762,14 @@ class DuplicateResolutionDialog:
 
     def open_pdf(self, filename):
         """Open the PDF file in the default viewer"""
+        pdf_path = os.path.join(self.input_dir, filename)
+        if not os.path.exists(pdf_path):
+            messagebox.showerror("Error", f"Could not find PDF file: {filename}")
+            return
         try:
-            pdf_path = os.path.join(self.input_dir, filename)
-            if os.path.exists(pdf_path):
-                os.startfile(pdf_path)  # Windows
-            else:
-                messagebox.showerror("Error", f"Could not find PDF file: {filename}")
-        except AttributeError:
-            try:
-                import subprocess
-                subprocess.call(['open', pdf_path])  # macOS
-            except:
-                try:
-                    subprocess.call(['xdg-open', pdf_path])  # Linux
-                except:
-                    messagebox.showerror("Error", f"Could not open PDF: {filename}")
+            open_with_default_app(pdf_path)
+        except OSError:
+            messagebox.showerror("Error", f"Could not open PDF: {filename}")
 
     def confirm_selections(self):
         """Store the selected drawings and close the dialog"""
@@ -691,6 +785,37 @@ class DuplicateResolutionDialog:
         self.dialog.wait_window()
         return getattr(self, 'final_selections', {})
 
+# Column headings of the results file, matching the rows from iter_result_rows
+RESULT_COLUMNS = ['Drawing Number', 'Revision', 'Title', 'Total Weight (KG)', 'Page Weights', 'Filename']
+
+def iter_result_rows(processed_drawings):
+    """
+    Flatten processed drawings into one row per drawing for display and export.
+    
+    Yields:
+        tuple: (drawing_number, revision, title, weight, page_weights, filename)
+    """
+    for drawing_number, drawings in processed_drawings.items():
+        for drawing in drawings:
+            yield (drawing_number, drawing.get('revision', ''), drawing['title'],
+                   drawing['weight'], drawing['page_weights'], drawing['filename'])
+
+# Command that opens a file with its default application, chosen once for the platform;
+# None means Windows, where os.startfile is used instead
+if sys.platform == 'win32':
+    _OPEN_CMD = None
+elif sys.platform == 'darwin':
+    _OPEN_CMD = 'open'
+else:
+    _OPEN_CMD = 'xdg-open'
+
+def open_with_default_app(path):
+    """Open a file with the platform's default application. Raises OSError on failure."""
+    if _OPEN_CMD is None:
+        os.startfile(path)
+    else:
+        subprocess.Popen([_OPEN_CMD, path])
+
 def select_directory(title):
     """Open a file dialog to select a directory."""
     root = tk.Tk()
@@ -698,20 +823,60 @@ def select_directory(title):
     directory = filedialog.askdirectory(title=title)
     return directory
 
+# Patterns for the drawing number in a filename, in order of preference
+_DRAWING_NUMBER_PATTERNS = [
+    re.compile(r'-(\d{4})(?:_|$)'),  # Matches -2000_ or -2000
+    re.compile(r'(\d{4})(?:_|$)'),   # Matches 2000_ or 2000
+    re.compile(r'DR-S-(\d{4})'),     # Matches DR-S-2000
+    re.compile(r'FN-DR-S-(\d{4})'),  # Matches FN-DR-S-2000
+    re.compile(r'Drawing\s*No\.\s*(\d{4})')  # Matches Drawing No. 2000
+]
+
+# Parts of a filename removed to leave the title, applied in order
+_TITLE_CLEANUP_PATTERNS = [
+    # Drawing number and revision patterns
+    re.compile(r'-\d{4}(?:_|$)'),
+    re.compile(r'DR-S-\d{4}'),
+    re.compile(r'FN-DR-S-\d{4}'),
+    re.compile(r'Drawing\s*No\.\s*\d{4}'),
+    
+    # Revision patterns
+    re.compile(r'_C\d{2}(?:_|$)'),
+    re.compile(r'_Construction_C\d{2}(?:_|$)'),
+    re.compile(r'_BBS_Construction_C\d{2}(?:_|$)'),
+    
+    # Common prefixes
+    re.compile(r'^1055-ACE-[A-Z]{2}-[0-9]{2}-[A-Z]{2}-S-'),
+    re.compile(r'^1055-ACE-[A-Z]{2}-FN-DR-S-')
+]
+# Literal prefixes removed after the patterns above, in order
+_TITLE_PREFIXES = ('BBS_', '_')
+_UNDERSCORES = re.compile(r'_+')
+
+# Revision patterns in order of preference. The first two have no group and
+# return the whole match (e.g. "C02"); the others return the captured revision.
+_REVISION_PATTERNS = [
+    re.compile(r'[_\s]C\d{2}\b', re.IGNORECASE),
+    re.compile(r'\bC\d{2}\b', re.IGNORECASE),
+    re.compile(r'REV[.:]\s*([A-Z0-9]+)', re.IGNORECASE),
+    re.compile(r'REVISION[.:]\s*([A-Z0-9]+)', re.IGNORECASE),
+    re.compile(r'Rev\.\s*([A-Z0-9]+)', re.IGNORECASE),
+    re.compile(r'Revision\s*([A-Z0-9]+)', re.IGNORECASE)
+]
+
+# Size of the text tail searched for a revision before falling back to the whole text
+_REVISION_TAIL_CHARS = 4096
+
+@lru_cache(maxsize=4096)
 def extract_drawing_info(filename):
-    """Extract drawing number and title from filename"""
+    """
+    Extract drawing number and title from filename.
+    Pure string work on the name, so results are cached per filename.
+    """
     # Try different patterns for drawing number
-    drawing_patterns = [
-        r'-(\d{4})(?:_|$)',  # Matches -2000_ or -2000
-        r'(\d{4})(?:_|$)',   # Matches 2000_ or 2000
-        r'DR-S-(\d{4})',     # Matches DR-S-2000
-        r'FN-DR-S-(\d{4})',  # Matches FN-DR-S-2000
-        r'Drawing\s*No\.\s*(\d{4})'  # Matches Drawing No. 2000
-    ]
-    
     drawing_number = ""
-    for pattern in drawing_patterns:
-        match = re.search(pattern, filename)
+    for pattern in _DRAWING_NUMBER_PATTERNS:
+        match = pattern.search(filename)
         if match:
             drawing_number = match.group(1)
             break
@@ -720,46 +885,44 @@ def extract_drawing_info(filename):
     # Remove file extension and common prefixes
     title = filename.replace('.pdf', '')
     
-    # Remove drawing number and revision patterns
-    title = re.sub(r'-\d{4}(?:_|$)', '', title)
-    title = re.sub(r'DR-S-\d{4}', '', title)
-    title = re.sub(r'FN-DR-S-\d{4}', '', title)
-    title = re.sub(r'Drawing\s*No\.\s*\d{4}', '', title)
-    
-    # Remove revision patterns
-    title = re.sub(r'_C\d{2}(?:_|$)', '', title)
-    title = re.sub(r'_Construction_C\d{2}(?:_|$)', '', title)
-    title = re.sub(r'_BBS_Construction_C\d{2}(?:_|$)', '', title)
+    # Remove drawing number, revision patterns and common prefixes
+    for pattern in _TITLE_CLEANUP_PATTERNS:
+        title = pattern.sub('', title)
+    for prefix in _TITLE_PREFIXES:
+        if title.startswith(prefix):
+            title = title[len(prefix):]
     
-    # Remove common prefixes and clean up
-    title = re.sub(r'^1055-ACE-[A-Z]{2}-[0-9]{2}-[A-Z]{2}-S-', '', title)
-    title = re.sub(r'^1055-ACE-[A-Z]{2}-FN-DR-S-', '', title)
-    title = re.sub(r'^BBS_', '', title)
-    title = re.sub(r'^_', '', title)
-    title = re.sub(r'_+', ' ', title)
+    # Clean up
+    title = _UNDERSCORES.sub(' ', title)
     title = title.strip()
     
     return drawing_number, title
 
 def extract_revision(text):
-    """Extract revision number from text."""
-    patterns = [
-        r'[_\s]C\d{2}\b',
-        r'\bC\d{2}\b',
-        r'REV[.:]\s*([A-Z0-9]+)',
-        r'REVISION[.:]\s*([A-Z0-9]+)',
-        r'Rev\.\s*([A-Z0-9]+)',
-        r'Revision\s*([A-Z0-9]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    """
+    Extract revision number from text.
+    Revisions normally sit in the title block at the end of the drawing, so each
+    pattern is tried on the last _REVISION_TAIL_CHARS characters before the whole text.
+    """
+    tail_start = max(0, len(text) - _REVISION_TAIL_CHARS)
+    for pattern in _REVISION_PATTERNS:
+        # Searching from an offset (rather than a slice) keeps \b correct at the cut
+        match = pattern.search(text, tail_start)
+        if not match and tail_start:
+            match = pattern.search(text)
         if match:
-            if pattern.startswith(r'[_\s]C') or pattern.startswith(r'\bC'):
+            if not pattern.groups:
                 return match.group(0).strip()
             return match.group(1)
     return ""
 
+# Title patterns searched in the PDF text, most specific first
+_TITLE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'TITLE[.:]\s*(.+?)(?=\n|$)',
+    r'DRAWING TITLE[.:]\s*(.+?)(?=\n|$)',
+    r'(?<=\n)(?!REV|DATE|SCALE)([A-Z][A-Z\s]+(?:\s+\d+(?:\s*TO\s*\d+)?)+)(?=\n)'
+)]
+
 def extract_title(text, filename):
     """Extract title from text or filename."""
     # Try to extract from filename first
@@ -771,224 +934,403 @@ def extract_title(text, filename):
             return potential_title
     
     # Look for common title patterns in the text
-    patterns = [
-        r'TITLE[.:]\s*(.+?)(?=\n|$)',
-        r'DRAWING TITLE[.:]\s*(.+?)(?=\n|$)',
-        r'(?<=\n)(?!REV|DATE|SCALE)([A-Z][A-Z\s]+(?:\s+\d+(?:\s*TO\s*\d+)?)+)(?=\n)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
     
     return ""
 
+def _text_cache_path(pdf_path):
+    """
+    Cache file for the current version of a PDF, keyed by the cache version,
+    text extraction library, path, modification time and size.
+    """
+    stat = os.stat(pdf_path)
+    key = (f"{_TEXT_CACHE_VERSION}|{_TEXT_BACKEND}|{os.path.abspath(pdf_path)}|"
+           f"{stat.st_mtime_ns}|{stat.st_size}")
+    return os.path.join(_TEXT_CACHE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+def read_pages_text(pdf_path):
+    """
+    Return the plain text of each page. Text extracted by an earlier run is read
+    back from the disk cache; a PDF that changed since then is parsed again.
+    """
+    if not _text_cache_enabled:
+        return _parse_pages_text(pdf_path)
+    
+    cache_path = _text_cache_path(pdf_path)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            pages_text = json.load(f)
+    except (OSError, ValueError):
+        pass
+    else:
+        # Mark the entry as recently used so pruning keeps it
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return pages_text
+    
+    pages_text = _parse_pages_text(pdf_path)
+    
+    # The cache only saves time, so failing to write it is not an error.
+    # Writing to a temporary name first keeps a half-written file from being read.
+    # Text that cannot be encoded (e.g. a lone surrogate from a broken ToUnicode
+    # map) raises UnicodeEncodeError, a ValueError, and is simply not cached.
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_TEXT_CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(pages_text, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return pages_text
+
+def prune_text_cache():
+    """
+    Remove text cache entries unused for longer than _TEXT_CACHE_MAX_AGE, then the
+    least recently used ones until the cache fits in _TEXT_CACHE_MAX_BYTES.
+    """
+    try:
+        with os.scandir(_TEXT_CACHE_DIR) as entries:
+            files = []
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+    
+    now = time.time()
+    total_size = 0
+    # Most recently used first, so the entries past the size cap are the oldest
+    for mtime, size, path in sorted(files, reverse=True):
+        total_size += size
+        if now - mtime > _TEXT_CACHE_MAX_AGE or total_size > _TEXT_CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _parse_pages_text(pdf_path):
+    """Parse the text of each page, using PyMuPDF or pypdfium2 when installed and PyPDF2 otherwise."""
+    if fitz is not None:
+        with fitz.open(pdf_path) as doc:
+            return [page.get_text("text") for page in doc]
+    
+    if pdfium is not None:
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            # PDFium ends lines with "\r\n"; the weight search splits pages on "\n"
+            return [page.get_textpage().get_text_range().replace('\r\n', '\n') for page in doc]
+        finally:
+            doc.close()
+    
+    # Parse from memory: one read instead of PyPDF2's many small seeks and reads
+    with open(pdf_path, 'rb') as file:
+        data = file.read()
+    reader = PdfReader(io.BytesIO(data), strict=False)
+    # Pages without a content stream are blank; they keep their slot so page numbers line up
+    return [page.extract_text() if '/Contents' in page else "" for page in reader.pages]
+
 def extract_text_from_pdf(pdf_path):
     """Extract text and information from a single PDF file."""
     try:
-        reader = PdfReader(pdf_path)
         # Store text from each page separately
-        pages_text = []
-        for page in reader.pages:
-            pages_text.append(page.extract_text())
+        pages_text = read_pages_text(pdf_path)
         # Also return combined text for other extractions
         full_text = "\n".join(pages_text)
         return full_text, pages_text
     except Exception as e:
-        print(f"Error processing {pdf_path}: {str(e)}")
+        logger.error("Error processing %s: %s", pdf_path, e)
         return None, None
 
-def extract_total_weight(pdf_path, output_dir):
+# Comprehensive set of regex patterns for weight extraction
+# Each pattern handles a different format or edge case
+_WEIGHT_PATTERN_SOURCES = [
+    # Standard formats with explicit "Total Weight" or "KG" units
+    r'Total\s+Weight\s*=\s*(\d+[.,]?\d*)\s*KG',
+    r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+[.,]?\d*)',
+    r'Total\s*(\d+[.,]?\d*)',
+    r'Total(\d+)[.,](\d+)',
+    r'Total(\d+)',
+    
+    # Variations with different separators
+    r'Total\s*(\d+)\s*[.,]\s*(\d+)',
+    r'Total\s*(\d+)\s*[.,]?\s*(\d+)',
+    
+    # Patterns are tried on one line at a time, so variants that need a line break
+    # ("\n" or "$" followed by more digits) could never match and are not listed.
+    # Neither are variants whose every match is also a match of an earlier
+    # two-group pattern above (trailing "KG", "\r" between the parts, doubled
+    # "\s*"), since a two-group match always converts and ends the search, nor
+    # the space-separated digit groups, which only got a turn on lines where they
+    # found the same matches as r'Total\s*(\d+[.,]?\d*)'.
+]
+
+# Compiled once for all PDFs
+_WEIGHT_PATTERNS = [(source, re.compile(source, re.IGNORECASE | re.MULTILINE))
+                    for source in _WEIGHT_PATTERN_SOURCES]
+
+# All weight patterns as one alternation, so a line that none of them matches is
+# rejected in a single scan. It only decides whether a line is worth trying: a union
+# returns the leftmost match, while the patterns are ranked by their order above.
+_WEIGHT_UNION = re.compile("|".join(f"(?:{source})" for source in _WEIGHT_PATTERN_SOURCES),
+                           re.IGNORECASE | re.MULTILINE)
+
+# Lowercases ASCII letters only, keeping every character at its offset. Only ASCII
+# letters match "total" case-insensitively, so this is enough to find candidate lines.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# A weight split across lines: "Total" alone on a line, the whole part (optionally
+# ending with a period) alone on the next, and the decimal part, optionally after a
+# period, at the start of the line after that. [^\S\n] is whitespace within a line.
+_SPLIT_TOTAL = re.compile(r'[^\S\n]*total[^\S\n]*\n'
+                          r'[^\S\n]*(\d+)\.?[^\S\n]*\n'
+                          r'[^\S\n]*\.?(\d+)', re.IGNORECASE)
+
+# Patterns for the line after a weight, applied to single stripped lines
+_DIGITS_LINE = re.compile(r'^\s*(\d+)\s*$')
+_SINGLE_DIGIT_LINE = re.compile(r'^\s*(\d)\s*$')
+_DECIMAL_AFTER_SEPARATOR = re.compile(r'[.,]\s*(\d+)')
+
+def _line_after(text, line_end):
+    """
+    Return (line, end) for the line following the one that ends at offset line_end,
+    where end is the offset of its terminating newline (or the end of the text).
+    The caller checks that line_end < len(text), i.e. that there is a next line.
+    """
+    start = line_end + 1
+    end = text.find('\n', start)
+    if end == -1:
+        end = len(text)
+    return text[start:end], end
+
+def _iter_total_lines(text, lowered):
+    """
+    Yield (line, line_end) for each line of the page containing "Total", where
+    lowered is the page text passed through _ASCII_LOWER. str.find jumps from one
+    occurrence to the next, so the rest of the page is never walked line by line.
+    """
+    pos = lowered.find('total')
+    while pos != -1:
+        line_start = text.rfind('\n', 0, pos) + 1
+        line_end = text.find('\n', pos)
+        if line_end == -1:
+            line_end = len(text)
+        yield text[line_start:line_end], line_end
+        # Further occurrences on the same line belong to the line just yielded
+        pos = lowered.find('total', line_end)
+
+def _scan_page_for_weight(page_num, text):
+    """
+    Find the weight on one page, trying both strategies on each line and
+    returning as soon as one of them yields a weight.
+    
+    Args:
+        page_num: Zero-based page index, used in log messages
+        text: Text of the page
+        
+    Returns:
+        float: The weight found, or None if the page has none
+    """
+    # Both strategies need "Total" on the line, so only those lines are visited; the
+    # lines after a candidate are sliced out only when a strategy needs them.
+    for line, line_end in _iter_total_lines(text, text.translate(_ASCII_LOWER)):
+        # Strategy 1: Look for "Total" on its own line
+        # This handles cases where the number is split across multiple lines
+        split_match = _SPLIT_TOTAL.match(text, line_end - len(line))
+        if split_match:
+            whole_part, decimal_part = split_match.groups()
+            weight = float(f"{whole_part}.{decimal_part}")
+            logger.debug("Found split number on page %d:", page_num + 1)
+            logger.debug("Whole part: %s", whole_part)
+            logger.debug("Decimal part: %s", decimal_part)
+            logger.debug("Extracted weight: %s KG", weight)
+            return weight
+        
+        # Strategy 2: Try all regex patterns, in order, on lines where any of them matches
+        if not _WEIGHT_UNION.search(line):
+            continue
+        for pattern, compiled_pattern in _WEIGHT_PATTERNS:
+            for match in compiled_pattern.finditer(line):
+                try:
+                    # Handle different match group configurations
+                    if len(match.groups()) == 2:
+                        # Direct match of whole and decimal parts
+                        whole_part = match.group(1).replace(' ', '')
+                        decimal_part = match.group(2)
+                        weight = float(f"{whole_part}.{decimal_part}")
+                    else:
+                        # Handle single group matches with various formats
+                        weight_str = match.group(1).replace(' ', '')
+                        
+                        # Case 1: Line ends with a period
+                        if line.strip().endswith('.'):
+                            if line_end < len(text):
+                                next_line = _line_after(text, line_end)[0].strip()
+                                decimal_match = _DIGITS_LINE.search(next_line)
+                                if decimal_match:
+                                    weight = float(f"{weight_str}.{decimal_match.group(1)}")
+                                else:
+                                    weight = float(weight_str)
+                            else:
+                                weight = float(weight_str)
+                        else:
+                            # Case 2: Look for decimal part in current line
+                            decimal_match = _DECIMAL_AFTER_SEPARATOR.search(line, match.end())
+                            if decimal_match:
+                                weight = float(f"{weight_str}.{decimal_match.group(1)}")
+                            else:
+                                # Case 3: Check next line for additional digits
+                                if line_end < len(text):
+                                    next_line = _line_after(text, line_end)[0].strip()
+                                    digit_match = _SINGLE_DIGIT_LINE.search(next_line)
+                                    if digit_match:
+                                        weight_str += digit_match.group(1)
+                                        logger.debug("Found additional digit on next line: %s", digit_match.group(1))
+                                weight = float(weight_str)
+                except ValueError:
+                    logger.debug("Could not convert weight value on page %d", page_num + 1)
+                    continue
+                
+                logger.debug("Found weight on page %d: %s KG (using pattern: %s)", page_num + 1, weight, pattern)
+                return weight
+    
+    return None
+
+def extract_total_weight(pages_text, pdf_name):
     """
-    Extract total weight from PDF using multiple strategies and patterns.
+    Extract total weight from the page text of a PDF using multiple strategies and patterns.
     Handles various formats including split numbers, line breaks, and different separators.
     
     Args:
-        pdf_path: Path to the PDF file
-        output_dir: Directory for debug output
+        pages_text: List of page texts, as returned by extract_text_from_pdf
+        pdf_name: Name of the PDF file, used in log messages
         
     Returns:
         tuple: (total_weight, page_weights) where page_weights is a list of (page_num, weight) tuples
     """
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PdfReader(file)
-            total_weight = 0
-            page_weights = []
-            
-            # Comprehensive set of regex patterns for weight extraction
-            # Each pattern handles a different format or edge case
-            weight_patterns = [
-                # Standard formats with explicit "Total Weight" or "KG" units
-                r'Total\s+Weight\s*=\s*(\d+[.,]?\d*)\s*KG',
-                r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+[.,]?\d*)',
-                r'Total\s*(\d+[.,]?\d*)',
-                r'Total(\d+)[.,](\d+)',
-                r'Total(\d+)',
-                
-                # Variations with different separators and optional units
-                r'Total\s*(\d+)\s*[.,]\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]?\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]?\s*(\d+)\s*KG',
-                r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)',
-                r'Total\s*(\d+(?:\s+\d+)*[.,]?\d*)\s*KG',
-                
-                # Patterns for handling line breaks with different line endings
-                r'Total\s*(\d+)\s*[.,]\s*\n\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]\s*\r\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]\s*\r\n\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]\s*$[\n\r]*\s*(\d+)',
-                
-                # Generic patterns for line breaks and whitespace
-                r'Total\s*(\d+)\s*[.,]\s*[\n\r]+\s*(\d+)',
-                r'Total\s*(\d+)\s*[.,]\s*\s*(\d+)',
-                
-                # Patterns for numbers split across lines with periods
-                r'Total\s*(\d+)\s*\.\s*\n\s*(\d+)',
-                r'Total\s*(\d+)\s*\.\s*\r\s*(\d+)',
-                r'Total\s*(\d+)\s*\.\s*\r\n\s*(\d+)',
-                r'Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-                
-                # Special cases for numbers ending with periods
-                r'Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-                r'All\s+Bars\s+in\s+this\s+sheet\s+Total\s*(\d+)\s*\.\s*$[\n\r]*\s*(\d+)',
-                
-                # Specific patterns for the target PDF format
-                r'Total\s*\n\s*(\d+)\s*\n\s*\.\s*(\d+)',
-                r'Total\s*\n\s*(\d+)\s*\.\s*\n\s*(\d+)',
-                r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)',
-                r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)\s*Status',
-                r'Total\s*\n\s*(\d+)\s*\.\s*(\d+)\s*Status\s+C\s*\(Resubmit\)'
-            ]
-            
-            # Process each page of the PDF
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                text = page.extract_text()
-                
-                # Process text line by line for better handling of line breaks
-                lines = text.split('\n')
-                
-                # Look for weight information using multiple strategies
-                weight_found = False
-                for i, line in enumerate(lines):
-                    # Strategy 1: Look for "Total" on its own line
-                    # This handles cases where the number is split across multiple lines
-                    if line.strip().lower() == "total" and i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
-                        # Look for a number that might end with a period
-                        number_match = re.search(r'^(\d+)(?:\.)?$', next_line)
-                        if number_match:
-                            whole_part = number_match.group(1)
-                            # Check next line for decimal part
-                            if i + 2 < len(lines):
-                                decimal_line = lines[i + 2].strip()
-                                decimal_match = re.search(r'^\.?(\d+)', decimal_line)
-                                if decimal_match:
-                                    decimal_part = decimal_match.group(1)
-                                    weight = float(f"{whole_part}.{decimal_part}")
-                                    total_weight += weight
-                                    page_weights.append((page_num + 1, weight))
-                                    print(f"Found split number on page {page_num + 1}:")
-                                    print(f"Whole part: {whole_part}")
-                                    print(f"Decimal part: {decimal_part}")
-                                    print(f"Extracted weight: {weight} KG")
-                                    weight_found = True
-                                    break
-                    
-                    # Strategy 2: Try all regex patterns
-                    if not weight_found:
-                        for pattern in weight_patterns:
-                            matches = re.finditer(pattern, line, re.IGNORECASE | re.MULTILINE)
-                            for match in matches:
-                                try:
-                                    # Handle different match group configurations
-                                    if len(match.groups()) == 2:
-                                        # Direct match of whole and decimal parts
-                                        whole_part = match.group(1).replace(' ', '')
-                                        decimal_part = match.group(2)
-                                        weight = float(f"{whole_part}.{decimal_part}")
-                                    else:
-                                        # Handle single group matches with various formats
-                                        weight_str = match.group(1).replace(' ', '')
-                                        
-                                        # Case 1: Line ends with a period
-                                        if line.strip().endswith('.'):
-                                            if i + 1 < len(lines):
-                                                next_line = lines[i + 1].strip()
-                                                decimal_match = re.search(r'^\s*(\d+)\s*$', next_line)
-                                                if decimal_match:
-                                                    weight = float(f"{weight_str}.{decimal_match.group(1)}")
-                                                else:
-                                                    weight = float(weight_str)
-                                            else:
-                                                weight = float(weight_str)
-                                        else:
-                                            # Case 2: Look for decimal part in current line
-                                            decimal_match = re.search(r'[.,]\s*(\d+)', line[match.end():])
-                                            if decimal_match:
-                                                weight = float(f"{weight_str}.{decimal_match.group(1)}")
-                                            else:
-                                                # Case 3: Check next line for additional digits
-                                                if i + 1 < len(lines):
-                                                    next_line = lines[i + 1].strip()
-                                                    digit_match = re.search(r'^\s*(\d)\s*$', next_line)
-                                                    if digit_match:
-                                                        weight_str += digit_match.group(1)
-                                                        print(f"Found additional digit on next line: {digit_match.group(1)}")
-                                                weight = float(weight_str)
-                                    
-                                    total_weight += weight
-                                    page_weights.append((page_num + 1, weight))
-                                    print(f"Found weight on page {page_num + 1}: {weight} KG (using pattern: {pattern})")
-                                    weight_found = True
-                                    break
-                                except ValueError:
-                                    print(f"Warning: Could not convert weight value on page {page_num + 1}")
-                                    continue
-                            
-                            if weight_found:
-                                break
-                    
-                    if weight_found:
-                        break
-                
-                if not weight_found:
-                    print(f"No weight found on page {page_num + 1}")
-                    # Print last 200 characters of text for debugging
-                    print(f"Last 200 chars: {text[-200:]}")
-            
-            # Check if this PDF should be included in final output
-            if total_weight > 0:
-                print(f"Found weight for {os.path.basename(pdf_path)}: {total_weight} KG")
-                print(f"Page weights: {page_weights}")
-            else:
-                print(f"EXCLUDED: {os.path.basename(pdf_path)} - No weight found")
-            
-            return total_weight, page_weights
+        total_weight = 0
+        page_weights = []
+        
+        # Process each page of the PDF; each contributes at most one weight
+        for page_num, text in enumerate(pages_text):
+            weight = _scan_page_for_weight(page_num, text)
+            if weight is None:
+                logger.debug("No weight found on page %d", page_num + 1)
+                # Log last 200 characters of text for debugging
+                logger.debug("Last 200 chars: %s", text[-200:])
+                continue
             
+            total_weight += weight
+            page_weights.append((page_num + 1, weight))
+        
+        # Check if this PDF should be included in final output
+        if total_weight > 0:
+            logger.debug("Found weight for %s: %s KG", pdf_name, total_weight)
+            logger.debug("Page weights: %s", page_weights)
+        else:
+            logger.debug("EXCLUDED: %s - No weight found", pdf_name)
+        
+        return total_weight, page_weights
+        
     except Exception as e:
-        print(f"Error processing {pdf_path}: {str(e)}")
+        logger.error("Error processing %s: %s", pdf_name, e)
         return 0, []
 
+def _process_one(pdf_path):
+    """
+    Extract drawing info, revision and weights for a single PDF.
+    Runs in a worker process of PDFAnalyzerGUI.process_pdfs.
+    
+    Returns:
+        tuple: (drawing_number, drawing dictionary), or None if the filename
+        has no drawing number or title
+    """
+    pdf_file = os.path.basename(pdf_path)
+    
+    # Extract drawing info
+    drawing_number, title = extract_drawing_info(pdf_file)
+    if not (drawing_number and title):
+        return None
+    
+    # Extract the PDF text once; revision and weights both use it
+    full_text, pages_text = extract_text_from_pdf(pdf_path)
+    if full_text:  # Check if text extraction was successful
+        revision = extract_revision(full_text)
+    else:
+        revision = ""
+    
+    # Process the page text and get weights
+    if pages_text is not None:
+        weight, page_weights = extract_total_weight(pages_text, pdf_file)
+    else:
+        weight, page_weights = 0, []
+    
+    return drawing_number, {
+        'title': title,
+        'revision': revision,
+        'weight': weight,
+        'page_weights': page_weights,
+        'filename': pdf_file
+    }
+
 def save_detailed_weights(weights_data, output_dir):
     """
     Save detailed weight information to a CSV file for analysis.
-    Includes filename, drawing number, weight, pattern used, and page number.
+    Includes filename, drawing number, weight, pattern used, and page number;
+    the pattern is not recorded by the extractor, so it is written as N/A.
     """
     csv_path = os.path.join(output_dir, 'detailed_weights.csv')
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['Filename', 'Drawing Number', 'Weight (kg)', 'Pattern Used', 'Page Number'])
-        for item in weights_data:
-            writer.writerow([
-                item['filename'],
-                item['drawing_number'],
-                item['weight'],
-                item['pattern'],
-                item.get('page', 'N/A')
-            ])
+        writer.writerows(
+            (item['filename'], item['drawing_number'], item['weight'],
+             item.get('pattern', 'N/A'), item.get('page', 'N/A'))
+            for item in weights_data)
+
+def _process_directory_file(pdf_path):
+    """
+    Extract the drawing information and weights of a single PDF.
+    Runs in a worker process of process_directory.
+    
+    Returns:
+        tuple: (DrawingInfo, weights_data), or None if no text could be extracted.
+        weights_data holds one row dictionary per page weight, for save_detailed_weights.
+    """
+    filename = os.path.basename(pdf_path)
+    
+    # Extract text from PDF
+    full_text, pages_text = extract_text_from_pdf(pdf_path)
+    if not full_text:
+        return None
+    
+    # Extract drawing information
+    drawing_number, title = extract_drawing_info(filename)
+    revision = extract_revision(full_text)
+    
+    # Extract weights
+    total_weight, page_weights = extract_total_weight(pages_text, filename)
+    weights_data = [{'filename': filename, 'drawing_number': drawing_number,
+                     'weight': weight, 'page': page_num}
+                    for page_num, weight in page_weights]
+    
+    drawing_info = DrawingInfo(
+        drawing_number=drawing_number,
+        revision=revision,
+        title=title,
+        total_weight=total_weight
+    )
+    return drawing_info, weights_data
 
 def process_directory(input_dir, output_dir):
     """
@@ -1019,45 +1361,37 @@ def process_directory(input_dir, output_dir):
         f.write("Weight Extraction Debug Log\n")
         f.write("=" * 50 + "\n")
 
-    # Process each PDF file
-    for filename in os.listdir(input_dir):
-        if filename.lower().endswith('.pdf'):
-            pdf_path = os.path.join(input_dir, filename)
-            print(f"\nProcessing: {filename}")
+    # Get all PDF files; scandir entries carry the name, full path and file type
+    with os.scandir(input_dir) as entries:
+        pdf_entries = [entry for entry in entries
+                       if entry.is_file() and entry.name.lower().endswith('.pdf')]
+    
+    # Process the PDFs in parallel, collecting results in file order
+    with ProcessPoolExecutor(max_workers=_MAX_WORKERS, initializer=_init_worker,
+                             initargs=(logger.getEffectiveLevel(), _text_cache_enabled)) as executor:
+        futures = [executor.submit(_process_directory_file, entry.path) for entry in pdf_entries]
+        for entry, future in zip(pdf_entries, futures):
+            filename = entry.name
+            logger.info("Processing: %s", filename)
             
             try:
-                # Extract text from PDF
-                full_text, pages_text = extract_text_from_pdf(pdf_path)
-                if not full_text:
-                    print(f"Failed to extract text from {filename}")
+                result = future.result()
+                if result is None:
+                    logger.warning("Failed to extract text from %s", filename)
                     failed += 1
                     continue
-                
-                # Extract drawing information
-                drawing_number, title = extract_drawing_info(filename)
-                revision = extract_revision(full_text)
-                
-                # Extract weights
-                total_weight, weights_data = extract_total_weight(pdf_path, output_dir)
+                drawing_info, weights_data = result
                 all_weights_data.extend(weights_data)
                 
-                # Create DrawingInfo object
-                drawing_info = DrawingInfo(
-                    drawing_number=drawing_number,
-                    revision=revision,
-                    title=title,
-                    total_weight=total_weight
-                )
-                
                 # Add to drawings dictionary
-                if drawing_number:
-                    drawings[drawing_number].append(drawing_info)
+                if drawing_info.drawing_number:
+                    drawings[drawing_info.drawing_number].append(drawing_info)
                 
                 processed += 1
-                print(f"Successfully processed {filename}")
+                logger.info("Successfully processed %s", filename)
                 
             except Exception as e:
-                print(f"Error processing {filename}: {str(e)}")
+                logger.error("Error processing %s: %s", filename, e)
                 failed += 1
     
     # Save results in multiple formats
@@ -1071,8 +1405,8 @@ def save_results(drawings, output_dir):
     Save the extracted information as CSV and JSON files.
     CSV format for easy viewing, JSON format for programmatic processing.
     """
-    # Convert to list of dictionaries
-    results = [info.to_dict() for info in drawings.values()]
+    # Convert to list of dictionaries, one per drawing including duplicates
+    results = [info.to_dict() for infos in drawings.values() for info in infos]
     
     # Save as CSV
     csv_path = os.path.join(output_dir, 'drawing_information.csv')
@@ -1085,9 +1419,26 @@ def save_results(drawings, output_dir):
         # Also save as JSON for easier processing
         json_path = os.path.join(output_dir, 'drawing_information.json')
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+def configure_logging(level):
+    """Log to the console at the given level."""
+    logging.basicConfig(level=level, format='%(levelname)s: %(message)s')
+
+def _init_worker(log_level, text_cache_enabled):
+    """Set up a PDF worker process with the main process's logging and cache settings."""
+    global _text_cache_enabled
+    configure_logging(log_level)
+    _text_cache_enabled = text_cache_enabled
 
 def main():
+    multiprocessing.freeze_support()  # Needed for the PDF worker pool in frozen builds
+    global _text_cache_enabled
+    configure_logging(logging.DEBUG if '--debug' in sys.argv[1:] else logging.INFO)
+    if '--no-cache' in sys.argv[1:]:
+        _text_cache_enabled = False
+    else:
+        prune_text_cache()
     root = tk.Tk()
     app = PDFAnalyzerGUI(root)
     root.mainloop()